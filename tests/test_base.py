@@ -1,6 +1,15 @@
+import gc
+import weakref
 import pytest
 from unittest.mock import Mock
-from toolfuse.base import Action, Observation, Tool, action, observation
+from toolfuse.base import (
+    Action,
+    Observation,
+    Tool,
+    _validator_for,
+    action,
+    observation,
+)
 
 
 def test_action_initialization_and_call():
@@ -66,7 +75,7 @@ class MockTool(Tool):
         pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool():
     return MockTool()
 
@@ -134,3 +143,406 @@ def test_parse_docstring(tool):
 
     observation_description = tool._parse_docstring(tool.mock_observation)
     assert observation_description == "Mock observation method"
+
+
+def test_register_methods_skips_properties():
+    class PropertyTool(MockTool):
+        @property
+        def connection(self):
+            raise AssertionError("property evaluated during registration")
+
+    tool = PropertyTool()
+    assert [action.name for action in tool.actions()] == ["mock_action"]
+    assert [obs.name for obs in tool.observations()] == ["mock_observation"]
+
+
+def test_schema_copied_per_instance():
+    first = MockTool()
+    second = MockTool()
+    assert first._actions_list[0].schema == second._actions_list[0].schema
+    first._actions_list[0].schema["description"] = "Edited"
+    assert second._actions_list[0].schema["description"] != "Edited"
+    assert MockTool()._actions_list[0].schema["description"] != "Edited"
+    assert first._actions_list[0].method() == "action_performed"
+    assert second._actions_list[0].method.__self__ is second
+
+
+def test_parse_docstring_first_sentence(tool):
+    def single_line():
+        """Does a thing. Then another."""
+
+    def line_break():
+        """Does a thing.
+        Then another. And more."""
+
+    def trailing_period():
+        """Does a thing."""
+
+    assert tool._parse_docstring(single_line) == "Does a thing"
+    assert tool._parse_docstring(line_break) == "Does a thing"
+    assert tool._parse_docstring(trailing_period) == "Does a thing."
+
+
+def test_action_schema_is_lazy(monkeypatch):
+    import toolcore
+
+    calls = []
+
+    class CountingWrapper(toolcore.FunctionWrapper):
+        def __init__(self, func, *args, **kwargs):
+            calls.append(func)
+            super().__init__(func, *args, **kwargs)
+
+    monkeypatch.setattr(toolcore, "FunctionWrapper", CountingWrapper)
+
+    def lazy_action(value: int) -> int:
+        """Returns the value given."""
+        return value
+
+    action_instance = Action("lazy_action", lazy_action)
+    assert calls == []
+    assert action_instance.description == "Returns the value given."
+    assert action_instance.schema["name"] == "lazy_action"
+    assert action_instance.schema["parameters"]["required"] == ["value"]
+    assert len(calls) == 1
+
+
+def test_marked_methods_collected_per_class():
+    class ExtendedTool(MockTool):
+        @action
+        def another_action(self):
+            """Another action method"""
+            return "another"
+
+    assert MockTool._toolfuse_marked_actions == ("mock_action",)
+    assert ExtendedTool._toolfuse_marked_actions == ("another_action", "mock_action")
+    assert ExtendedTool._toolfuse_marked_observations == ("mock_observation",)
+    assert [a.name for a in ExtendedTool().actions()] == [
+        "another_action",
+        "mock_action",
+    ]
+
+
+def test_find_action_in_wrapped_tool():
+    class OuterTool(Tool):
+        @action
+        def outer_action(self):
+            """Outer action method"""
+            return "outer"
+
+    outer = OuterTool(wraps=MockTool())
+    assert outer.find_action("outer_action").name == "outer_action"
+    assert outer.find_action("mock_observation").name == "mock_observation"
+    assert outer.find_action("non_existent") is None
+
+    def late_action():
+        """Late action method"""
+
+    outer.add_action(late_action)
+    assert outer.find_action("late_action") is not None
+
+
+def test_wrapped_actions_are_not_accumulated():
+    class OuterTool(Tool):
+        @action
+        def outer_action(self):
+            """Outer action method"""
+            return "outer"
+
+    outer = OuterTool(wraps=MockTool())
+    assert len(outer.actions()) == 2
+    assert len(outer.actions()) == 2
+    assert len(outer.observations()) == 1
+    assert len(outer.observations()) == 1
+    assert len(outer.json_schema()) == 3
+    assert outer.actions() is outer.actions()
+
+    def late_action():
+        """Late action method"""
+
+    outer.wraps.add_action(late_action)
+    assert [a.name for a in outer.actions()] == [
+        "outer_action",
+        "mock_action",
+        "late_action",
+    ]
+    outer.wraps = None
+    assert [a.name for a in outer.actions()] == ["outer_action"]
+
+
+def test_action_and_observation_use_slots():
+    action_instance = Action("test_action", Mock(), {}, "")
+    observation_instance = Observation("test_observation", Mock(), {}, "")
+    assert not hasattr(action_instance, "__dict__")
+    assert not hasattr(observation_instance, "__dict__")
+
+
+def test_json_schema_filters(tool):
+    assert [s["name"] for s in tool.json_schema(actions_only=True)] == ["mock_action"]
+    assert [s["name"] for s in tool.json_schema(exclude_names=["mock_action"])] == [
+        "mock_observation"
+    ]
+    filtered = tool.json_schema(exclude_names=["mock_action"])
+    filtered.clear()
+    assert len(tool.json_schema(exclude_names=["mock_action"])) == 1
+
+
+def test_parse_docstring_inherited(tool):
+    class InheritedTool(MockTool):
+        def mock_action(self):
+            return "overridden"
+
+    inherited = InheritedTool()
+    assert inherited._parse_docstring(inherited.mock_action) == "Mock action method"
+
+
+def test_json_schema_reflects_added_actions():
+    tool = MockTool()
+    first = tool.json_schema()
+    first.clear()
+    assert len(tool.json_schema()) == 2
+
+    def extra_action(value: str) -> str:
+        """Extra action method"""
+        return value
+
+    tool.add_action(extra_action)
+    assert len(tool.json_schema()) == 3
+    assert len(tool.json_schema(actions_only=True)) == 2
+
+
+def test_schema_cache_does_not_keep_functions_alive():
+    def temporary(value: int) -> int:
+        """Temporary action"""
+        return value
+
+    assert Action("temporary", temporary).description == "Temporary action"
+    assert Action("len", len).description
+    ref = weakref.ref(temporary)
+    del temporary
+    gc.collect()
+    assert ref() is None
+
+
+def test_validate_parameters_reuses_validator():
+    tool = MockTool()
+    schema = {
+        "type": "object",
+        "properties": {"value": {"type": "integer"}},
+        "required": ["value"],
+    }
+    tool._validate_parameters(schema, {"value": 2})
+    validator = _validator_for(schema)
+    tool._validate_parameters(schema, {"value": 3})
+    assert _validator_for(schema) is validator
+    assert _validator_for(dict(schema)) is not validator
+    with pytest.raises(ValueError, match="Parameter validation error"):
+        tool._validate_parameters(schema, {"value": "three"})
+    with pytest.raises(ValueError, match="Parameter validation error"):
+        tool._validate_parameters(schema, {})
+
+
+def test_ref_without_installed_package(tool):
+    ref = tool.ref()
+    assert ref.module == MockTool.__module__
+    assert ref.type == "MockTool"
+    assert ref.version is None
+    assert tool.ref() == ref
+
+
+def test_add_actions_and_observations_in_bulk():
+    def first(value: int) -> int:
+        """First action"""
+        return value
+
+    def second() -> str:
+        """Second observation"""
+        return "second"
+
+    tool = MockTool()
+    tool.json_schema()
+    tool.add_actions([first])
+    tool.add_observations([second])
+    assert tool.find_action("first").description == "First action"
+    assert isinstance(tool.find_action("second"), Observation)
+    assert len(tool.json_schema()) == 4
+
+
+def test_add_actions_and_observations_use_overridden_single_adds():
+    added = []
+
+    class RecordingTool(MockTool):
+        def add_action(self, method):
+            added.append(("action", method.__name__))
+            super().add_action(method)
+
+        def add_observation(self, method):
+            added.append(("observation", method.__name__))
+            super().add_observation(method)
+
+    def first() -> None:
+        """First method"""
+
+    def second() -> None:
+        """Second method"""
+
+    tool = RecordingTool()
+    tool.add_actions([first, second])
+    tool.add_observations([second])
+    assert added == [
+        ("action", "first"),
+        ("action", "second"),
+        ("observation", "second"),
+    ]
+    assert len(tool.json_schema()) == 5
+
+
+def test_class_and_static_methods_are_registered():
+    class DescriptorTool(Tool):
+        @classmethod
+        @action
+        def class_action(cls) -> str:
+            """Class action method"""
+            return cls.__name__
+
+        @staticmethod
+        @action
+        def static_action() -> str:
+            """Static action method"""
+            return "static"
+
+        @staticmethod
+        @observation
+        def static_observation() -> str:
+            """Static observation method"""
+            return "observed"
+
+    tool = DescriptorTool()
+    assert [a.name for a in tool.actions()] == ["class_action", "static_action"]
+    assert [o.name for o in tool.observations()] == ["static_observation"]
+    assert tool.use(tool.find_action("class_action")) == "DescriptorTool"
+    assert tool.observe(tool.find_action("static_observation")) == "observed"
+
+
+def test_add_actions_partial_failure_keeps_caches_fresh():
+    def good(value: int) -> int:
+        """Good action"""
+        return value
+
+    tool = MockTool()
+    tool.json_schema(actions_only=True)
+    tool.find_action("mock_action")
+    with pytest.raises(ValueError):
+        tool.add_actions([good, type])
+    assert tool.find_action("good") is not None
+    assert len(tool.json_schema(actions_only=True)) == 2
+
+
+def test_json_schema_follows_overridden_accessors_and_schema_changes():
+    def first() -> None:
+        """First action"""
+
+    def second() -> None:
+        """Second action"""
+
+    class DynamicTool(Tool):
+        def __init__(self):
+            self.dynamic = [Action("first", first, {"name": "first"})]
+            super().__init__()
+
+        def actions(self):
+            return self.dynamic
+
+    tool = DynamicTool()
+    assert len(tool.json_schema(actions_only=True)) == 1
+    assert tool.find_action("second") is None
+    tool.dynamic.append(Action("second", second, {"name": "second"}))
+    assert len(tool.json_schema(actions_only=True)) == 2
+    assert tool.find_action("second").name == "second"
+
+    mock = MockTool()
+    mock.json_schema(actions_only=True)
+    mock.actions()[0].schema = {"name": "renamed"}
+    assert mock.json_schema(actions_only=True) == [{"name": "renamed"}]
+
+
+def test_parse_docstring_override_provides_descriptions():
+    class CustomTool(MockTool):
+        def _parse_docstring(self, method):
+            return "CUSTOM"
+
+    tool = CustomTool()
+    assert tool.find_action("mock_action").description == "CUSTOM"
+    assert tool.find_action("mock_observation").description == "CUSTOM"
+    assert MockTool().find_action("mock_action").description == "Mock action method"
+
+
+def test_lookups_follow_entries_appended_to_returned_lists():
+    def appended() -> None:
+        """Appended action"""
+
+    tool = MockTool()
+    assert tool.find_action("appended") is None
+    assert len(tool.json_schema(actions_only=True)) == 1
+    tool.actions().append(Action("appended", appended))
+    assert tool.find_action("appended").name == "appended"
+    assert len(tool.json_schema(actions_only=True)) == 2
+
+    inner = MockTool()
+    outer = MockTool(wraps=inner)
+    assert len(outer.json_schema(actions_only=True)) == 2
+    inner.actions().append(Action("appended", appended))
+    assert len(outer.json_schema(actions_only=True)) == 3
+    assert outer.find_action("appended").name == "appended"
+
+
+def test_find_action_prefers_nearest_wrapped_tool():
+    class NearTool(Tool):
+        @action
+        def x(self):
+            """Near action"""
+            return "near"
+
+    class FarTool(Tool):
+        @action
+        def x(self):
+            """Far action"""
+            return "far"
+
+    outer = MockTool(wraps=NearTool(wraps=FarTool()))
+    assert outer.find_action("x").method() == "near"
+    assert outer.find_action("mock_action").method() == "action_performed"
+
+
+def test_marked_instance_and_late_class_attributes_are_registered():
+    def helper():
+        """Helper action"""
+        return "helper"
+
+    class InstanceTool(Tool):
+        def __init__(self):
+            self.helper = action(helper)
+            super().__init__()
+
+    assert [a.name for a in InstanceTool().actions()] == ["helper"]
+    assert InstanceTool().find_action("helper").method() == "helper"
+
+    class LateTool(Tool):
+        pass
+
+    assert LateTool().actions() == []
+
+    def late(self):
+        """Late action"""
+        return "late"
+
+    LateTool.late = action(late)
+    assert [a.name for a in LateTool().actions()] == ["late"]
+    assert LateTool().find_action("late").method() == "late"
+
+    class ShadowedTool(MockTool):
+        def __init__(self):
+            self.mock_action = lambda: "unmarked"
+            super().__init__()
+
+    assert ShadowedTool().actions() == []
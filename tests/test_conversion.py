@@ -1,4 +1,9 @@
+import functools
+import gc
+import weakref
+
 from toolfuse import (
+    action,
     tool,
     Tool,
 )  # Adjust the import based on your actual module name and structure
@@ -71,3 +76,109 @@ def test_tool_input_type_detection():
     assert isinstance(
         tool(my_object), Tool
     ), "tool should return a Tool instance for object input"
+
+
+def test_tool_classes_are_reused():
+    assert tool(MyClass) is tool(MyClass)
+    assert tool(my_function) is tool(my_function)
+    assert tool(my_object) is not tool(my_object)
+    assert type(tool(my_object)) is type(tool(MyClass()))
+    assert tool(MyClass()).obj_instance is not my_object
+
+
+def test_wrapped_functions_get_their_own_tool():
+    def times_hundred(function):
+        @functools.wraps(function)
+        def wrapper(x: int):
+            return function(x) * 100
+
+        return wrapper
+
+    def double(x: int):
+        return x * 2
+
+    DoubleTool = tool(double)
+    wrapped = times_hundred(double)
+    WrappedTool = tool(wrapped)
+    assert WrappedTool is not DoubleTool
+    assert WrappedTool is tool(wrapped)
+    wrapped_tool = WrappedTool()
+    assert wrapped_tool.use(wrapped_tool.actions()[0], 1) == 200
+
+
+def test_converted_tools_copy_schemas():
+    MyClassTool = tool(MyClass)
+    first, second = MyClassTool(), MyClassTool()
+    assert first.actions()[0].schema == second.actions()[0].schema
+    assert first.actions()[0].schema["parameters"]["required"] == ["x"]
+    first.actions()[0].schema["parameters"]["required"].append("y")
+    assert second.actions()[0].schema["parameters"]["required"] == ["x"]
+
+
+class ClassWithProperty(MyClass):
+    @property
+    def expensive(self) -> int:
+        raise AssertionError("property evaluated during conversion")
+
+
+def test_conversion_skips_properties():
+    assert [a.name for a in tool(ClassWithProperty)().actions()] == ["my_method"]
+    assert [a.name for a in tool(ClassWithProperty()).actions()] == ["my_method"]
+
+
+class ClassWithAction(MyClass):
+    @action
+    def marked(self, y: int) -> int:
+        """Returns y."""
+        return y
+
+
+def test_marked_methods_are_registered_once():
+    names = [a.name for a in tool(ClassWithAction)().actions()]
+    assert sorted(names) == ["marked", "my_method"]
+
+
+def test_converted_tool_parse_docstring_override():
+    class CustomTool(tool(MyClass)):
+        def _parse_docstring(self, method):
+            return "CUSTOM"
+
+    assert [a.description for a in CustomTool().actions()] == ["CUSTOM"]
+
+
+def test_converted_inputs_can_be_collected():
+    class Temporary:
+        def method(self, x: int) -> int:
+            return x
+
+    def temporary_function(x: int) -> int:
+        return x
+
+    assert tool(Temporary) is tool(Temporary)
+    assert tool(temporary_function) is tool(temporary_function)
+    tool(Temporary()).actions()
+    refs = [weakref.ref(Temporary), weakref.ref(temporary_function)]
+    del Temporary, temporary_function
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
+
+
+class ClassWithPrivateState:
+    def __init__(self):
+        self._version = "v2"
+        self._by_name = {"users": "u"}
+
+    def endpoint(self, path: str) -> str:
+        return f"/{self._version}/{path}"
+
+    def _entries(self) -> str:
+        return "entries"
+
+
+def test_tool_bookkeeping_does_not_clobber_user_attributes():
+    converted = tool(ClassWithPrivateState)()
+    converted.find_action("endpoint")
+    converted.add_action(my_function)
+    assert converted.endpoint("users") == "/v2/users"
+    assert converted._by_name == {"users": "u"}
+    assert converted._entries() == "entries"
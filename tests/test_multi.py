@@ -1,5 +1,5 @@
 import pytest
-from toolfuse import Tool, action, observation
+from toolfuse import Action, Tool, action, observation
 from toolfuse.multi import MultiTool
 
 
@@ -167,3 +167,53 @@ def test_add_action(weather_tool: WeatherTool):
 
     result = weather_tool.use(action, bar="baz")
     assert result == "Foobar baz"
+
+
+def test_merge_skips_existing_names(weather_tool: WeatherTool, chat_tool: ChatTool):
+    weather_tool.merge(chat_tool)
+    weather_tool.merge(chat_tool)
+    weather_tool.merge(WeatherTool())
+    assert len(weather_tool.actions()) == 2
+    assert len(weather_tool.observations()) == 2
+    assert weather_tool.find_action("send_message") is not None
+
+
+def test_merge_partial_failure_keeps_caches_fresh(
+    weather_tool: WeatherTool, chat_tool: ChatTool
+):
+    def unparseable(values: set) -> None:
+        """Action whose schema cannot be generated"""
+
+    chat_tool._actions_list.append(Action("unparseable", unparseable))
+    weather_tool.json_schema(actions_only=True)
+    weather_tool.find_action("get_weather")
+    with pytest.raises(Exception):
+        weather_tool.merge(chat_tool)
+    assert weather_tool.find_action("send_message") is not None
+    assert len(weather_tool.json_schema(actions_only=True)) == 2
+
+
+def test_merge_uses_overridden_add_hooks(chat_tool: ChatTool):
+    added = []
+
+    class RecordingTool(WeatherTool):
+        def _add_action(self, method, name=None, schema=None, description=None):
+            added.append(name)
+            super()._add_action(method, name, schema, description)
+
+    tool = RecordingTool()
+    tool.merge(chat_tool)
+    assert added == ["send_message"]
+    assert tool.find_action("send_message") is not None
+    assert tool.find_action("last_message") is not None
+
+
+def test_merge_names_unnamed_entries_after_their_method(weather_tool: WeatherTool):
+    def unnamed() -> None:
+        """Action without a name"""
+
+    other = ChatTool()
+    other._actions_list.append(Action("", unnamed))
+    weather_tool.merge(other)
+    assert weather_tool.find_action("unnamed") is not None
+    assert weather_tool.find_action("") is None
@@ -1,14 +1,200 @@
+import copy
 import inspect
 import re
 from abc import ABC
+from functools import lru_cache
 from importlib.metadata import version as pkgversion
 from inspect import getdoc, getmodule
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from itertools import chain
+from operator import attrgetter
+from types import FunctionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+if TYPE_CHECKING:
+    from .models import V1ToolRef
+
+# Matches the end of the first sentence in a docstring
+_FIRST_SENTENCE_RE = re.compile(r"\.\s+")
+
+# Schemas, descriptions and signatures derived from a callable, keyed by its underlying function and
+# then by whether it is bound. All are fully determined by the function, so they are shared by every
+# Tool instance. The functions are held weakly, so classes created on the fly can still be collected.
+# Schemas are mutable, so each Action takes its own copy of the cached one.
+_SCHEMA_CACHE: "WeakKeyDictionary[Callable, Dict[bool, Dict[str, Any]]]" = (
+    WeakKeyDictionary()
+)
+_DESCRIPTION_CACHE: "WeakKeyDictionary[Callable, Dict[bool, str]]" = WeakKeyDictionary()
+_SIGNATURE_CACHE: "WeakKeyDictionary[Callable, Dict[bool, inspect.Signature]]" = (
+    WeakKeyDictionary()
+)
+
+# Checked jsonschema validators, keyed by the id of their schema. The schema is kept in the entry,
+# so its id cannot be reused while the entry exists; the cache is emptied once it reaches its bound.
+_VALIDATOR_CACHE: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+_VALIDATOR_CACHE_SIZE = 1024
+
+
+def _cache_entry(
+    cache: WeakKeyDictionary, method: Callable
+) -> Tuple[Dict[bool, Any], bool]:
+    """
+    Returns the entry of a cache for a callable's underlying function, and whether it is bound.
+
+    Callables that cannot be weakly referenced, such as builtins, get a fresh entry each time,
+    so their results are not cached.
+    """
+    if inspect.ismethod(method):
+        function, bound = method.__func__, True
+    else:
+        function, bound = method, False
+    try:
+        entry = cache.get(function)
+        if entry is None:
+            entry = cache[function] = {}
+    except TypeError:
+        entry = {}
+    return entry, bound
+
+
+def _first_sentence(method: Callable) -> str:
+    """
+    Extracts the first sentence from a callable's docstring.
+
+    Args:
+        method (Callable): The callable from which to extract the docstring.
+
+    Returns:
+        str: The first sentence of the docstring, if available. Otherwise, an empty string.
+    """
+    docstring = getattr(method, "__doc__", None)
+    if not isinstance(docstring, str) or "\n" in docstring or "\t" in docstring:
+        # Only single-line docstrings are used as is; getdoc handles inherited docstrings
+        # and the indentation of multi-line ones
+        docstring = getdoc(method)
+    else:
+        docstring = docstring.lstrip()
+    if docstring:
+        # Fast path: no other period precedes the first ". ", so no regex is needed
+        head, _, _ = docstring.partition(". ")
+        if "." not in head:
+            return head
+        match = _FIRST_SENTENCE_RE.search(docstring)
+        return docstring[: match.start()] if match else docstring
+    return ""
+
+
+def _schema_for(method: Callable) -> Dict[str, Any]:
+    """Returns the FunctionWrapper schema of a callable, computing it at most once per function."""
+    entry, bound = _cache_entry(_SCHEMA_CACHE, method)
+    schema = entry.get(bound)
+    if schema is None:
+        # toolcore is imported on first use, so importing toolfuse does not pay for it
+        from toolcore import FunctionWrapper
+
+        schema = FunctionWrapper(method).schema
+        entry[bound] = schema
+    return schema
+
+
+def _description_for(method: Callable) -> str:
+    """Returns the docstring description of a callable, computing it at most once per function."""
+    entry, bound = _cache_entry(_DESCRIPTION_CACHE, method)
+    description = entry.get(bound)
+    if description is None:
+        description = _first_sentence(method)
+        entry[bound] = description
+    return description
+
+
+def _signature_for(method: Callable) -> inspect.Signature:
+    """Returns the signature of a callable, computing it at most once per function."""
+    entry, bound = _cache_entry(_SIGNATURE_CACHE, method)
+    signature = entry.get(bound)
+    if signature is None:
+        signature = inspect.signature(method)
+        entry[bound] = signature
+    return signature
+
+
+def _validator_for(schema: Dict[str, Any]) -> Any:
+    """
+    Returns a jsonschema validator for a schema, checking the schema at most once.
 
-from jsonschema import ValidationError, validate
-from toolcore import FunctionWrapper
+    Checking a schema against its metaschema is by far the most expensive part of
+    `jsonschema.validate`, and the schemas of actions are reused for every call.
+    """
+    entry = _VALIDATOR_CACHE.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
+@lru_cache(maxsize=None)
+def _package_version(name: str) -> Optional[str]:
+    """
+    Returns the installed version of a distribution, or None if it cannot be found.
 
-from .models import V1ToolRef
+    Reading distribution metadata searches sys.path, so the result is cached per name.
+    """
+    try:
+        return pkgversion(name)
+    except Exception:
+        return None
+
+
+def _public_functions(cls: type) -> List[Tuple[str, Callable]]:
+    """
+    Returns the public functions that instances of a class bind as methods, sorted by name.
+
+    The classes in the MRO are read directly, keeping the first definition of each name, and only
+    plain functions and classmethods are kept. Binding the returned names on an instance gives the
+    same methods as `inspect.getmembers(instance, inspect.ismethod)` restricted to public names,
+    without calling getattr on everything in dir(instance), so properties and other descriptors
+    are never evaluated.
+
+    Args:
+        cls (type): The class whose methods to collect.
+
+    Returns:
+        List[Tuple[str, Callable]]: (name, underlying function) pairs for each public method.
+    """
+    seen = set()
+    functions = []
+    for klass in cls.__mro__:
+        for name, raw in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if name.startswith("_"):
+                continue
+            if isinstance(raw, classmethod):
+                functions.append((name, raw.__func__))
+            elif isinstance(raw, FunctionType):
+                functions.append((name, raw))
+    functions.sort(key=lambda item: item[0])
+    return functions
 
 
 class Action:
@@ -24,9 +210,11 @@ class Action:
         name (str): The name of the action. This is typically a unique identifier.
         method (Callable): The callable method that is executed when the action is taken.
         schema (Dict): A dictionary that defines the structure and types of the parameters
-                       that the action expects.
+                       that the action expects. Derived from the method on first access
+                       if not provided.
         description (str): A human-readable description of what the action does and its
-                           purpose within the context of the agent's environment.
+                           purpose within the context of the agent's environment. Derived from
+                           the method's docstring on first access if not provided.
 
     Methods:
         __call__(*args, **kwargs) -> Any:
@@ -35,20 +223,52 @@ class Action:
             and keyword arguments.
     """
 
-    def __init__(self, name: str, method: Callable, schema: Dict, description: str):
+    __slots__ = ("name", "method", "_schema", "_description")
+
+    def __init__(
+        self,
+        name: str,
+        method: Callable,
+        schema: Optional[Dict] = None,
+        description: Optional[str] = None,
+    ):
         """
         Initializes a new instance of the Action class.
 
         Args:
             name (str): The name of the action.
             method (Callable): The callable method that implements the action.
-            schema (Dict): The schema defining the structure of the action's parameters.
-            description (str): A description of the action.
+            schema (Dict, optional): The schema defining the structure of the action's parameters.
+                If omitted, it is generated from the method when first accessed.
+            description (str, optional): A description of the action. If omitted, it is taken
+                from the method's docstring when first accessed.
         """
         self.name = name
         self.method = method
-        self.schema = schema
-        self.description = description
+        self._schema = schema
+        self._description = description
+
+    @property
+    def schema(self) -> Dict:
+        """The schema defining the structure of the action's parameters."""
+        if self._schema is None:
+            self._schema = copy.deepcopy(_schema_for(self.method))
+        return self._schema
+
+    @schema.setter
+    def schema(self, value: Dict) -> None:
+        self._schema = value
+
+    @property
+    def description(self) -> str:
+        """A description of the action."""
+        if self._description is None:
+            self._description = _description_for(self.method)
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
 
     def __call__(self, *args, **kwargs) -> Any:
         """
@@ -77,9 +297,11 @@ class Observation(Action):
         name (str): The name of the observation. This is typically a unique identifier.
         method (Callable): The callable method that is executed to obtain the observation.
         schema (Dict): A dictionary that defines the structure and types of the data
-                       that the observation returns.
+                       that the observation returns. Derived from the method on first access
+                       if not provided.
         description (str): A human-readable description of what the observation represents
                            and its purpose within the context of the agent's environment.
+                           Derived from the method's docstring on first access if not provided.
 
     Methods:
         __call__(*args, **kwargs) -> Any:
@@ -88,37 +310,7 @@ class Observation(Action):
             and keyword arguments.
     """
 
-    def __init__(self, name: str, method: Callable, schema: Dict, description: str):
-        """
-        Initializes a new instance of the Observation class.
-
-        Args:
-            name (str): The name of the observation.
-            method (Callable): The callable method that implements the observation.
-            schema (Dict): The schema defining the structure of the observation's data.
-            description (str): A description of the observation.
-        """
-        self.name = name
-        self.method = method
-        self.schema = schema
-        self.description = description
-
-    def __call__(self, *args, **kwargs) -> Any:
-        """
-        Executes the observation's method with the given arguments and keyword arguments.
-
-        This method allows the observation to be obtained in a manner similar to calling
-        a function, with the observation's method determining the exact data returned.
-
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-
-        Returns:
-            The result of the observation method execution, typically data about the
-            environment or the agent's state within it.
-        """
-        return self.method(*args, **kwargs)
+    __slots__ = ()
 
 
 def action(method: Callable) -> Callable:
@@ -171,6 +363,65 @@ class Tool(ABC):
     infrastructure for registering and managing these actions and observations.
     """
 
+    # Names of the methods marked as actions and observations, collected once per class, and the
+    # state of the class namespaces they were collected from
+    _toolfuse_marked_actions: Tuple[str, ...] = ()
+    _toolfuse_marked_observations: Tuple[str, ...] = ()
+    _toolfuse_marked_state: Optional[Tuple[Any, ...]] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Collects the methods marked as actions or observations when a Tool subclass is defined.
+
+        See `_toolfuse_collect_marked`; instances merely bind the collected names in
+        `_register_methods`.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._toolfuse_collect_marked()
+
+    @classmethod
+    def _toolfuse_collect_marked(cls) -> None:
+        """
+        Collects the names of the methods marked as actions or observations on the class.
+
+        The class hierarchy is walked once, looking at the callables defined on each class,
+        including the functions wrapped by classmethod and staticmethod, that have either the
+        '_is_action' or '_is_observation' attribute set to True. Properties and other descriptors
+        are never evaluated during the scan. The sizes of the namespaces are recorded, so that
+        attributes added to a class after its definition are picked up by a new scan.
+        """
+        seen = set()
+        actions = []
+        observations = []
+        for klass in cls.__mro__:
+            if klass is object:
+                continue
+            for name, raw in vars(klass).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                # The markers are set on the function that classmethod and staticmethod wrap
+                if isinstance(raw, (classmethod, staticmethod)):
+                    raw = raw.__func__
+                if not callable(raw):
+                    continue
+                if getattr(raw, "_is_action", False):
+                    actions.append(name)
+                elif getattr(raw, "_is_observation", False):
+                    observations.append(name)
+
+        # Registration order follows attribute name, as it did when scanning dir()
+        cls._toolfuse_marked_actions = tuple(sorted(actions))
+        cls._toolfuse_marked_observations = tuple(sorted(observations))
+        # The attribute is created before the state is taken, so that the state counts it
+        cls._toolfuse_marked_state = None
+        cls._toolfuse_marked_state = cls._toolfuse_namespace_state()
+
+    @classmethod
+    def _toolfuse_namespace_state(cls) -> Tuple[Any, ...]:
+        """Returns the MRO of the class and the number of attributes defined on each class in it."""
+        return cls.__mro__, tuple(len(vars(klass)) for klass in cls.__mro__)
+
     def __init__(self, wraps: Optional["Tool"] = None) -> None:
         """
         Initializes a new instance of the Tool class, setting up the lists for actions and observations
@@ -181,30 +432,138 @@ class Tool(ABC):
         """
         self._actions_list: List[Action] = []
         self._observations_list: List[Observation] = []
+        self._toolfuse_by_name: Optional[Tuple[Any, ...]] = None
+        self._toolfuse_merged: Optional[Tuple[Any, ...]] = None
         self._register_methods()
         self.wraps = wraps
 
     def _register_methods(self) -> None:
         """
-        Scans the Tool instance for methods marked as actions or observations and registers them.
-
-        This method looks for callable attributes of the instance that have either the '_is_action'
-        or '_is_observation' attribute set to True, indicating that they should be treated as actions
-        or observations, respectively. It then creates Action or Observation instances for these methods
-        and adds them to the appropriate list.
-        """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if callable(attr) and hasattr(attr, "_is_action"):
-                wrapper = FunctionWrapper(attr)
-                description = self._parse_docstring(attr)
-                action = Action(attr_name, attr, wrapper.schema, description)
-                self._actions_list.append(action)
-            elif callable(attr) and hasattr(attr, "_is_observation"):
-                wrapper = FunctionWrapper(attr)
-                description = self._parse_docstring(attr)
-                observation = Observation(attr_name, attr, wrapper.schema, description)
-                self._observations_list.append(observation)
+        Registers the methods of the Tool instance marked as actions or observations.
+
+        The marked methods are collected once per class when it is defined, see `__init_subclass__`,
+        and again if attributes were added to a class in its hierarchy since. Marked callables set
+        on the instance itself are registered as well, taking the place of the class attributes of
+        the same name. This method binds them to the instance and creates Action or Observation
+        instances for them, adding them to the appropriate list. Schemas and descriptions are
+        derived lazily, on first access.
+        """
+        cls = type(self)
+        if (
+            cls.__dict__.get("_toolfuse_marked_state")
+            != cls._toolfuse_namespace_state()
+        ):
+            cls._toolfuse_collect_marked()
+        actions: Iterable[str] = cls._toolfuse_marked_actions
+        observations: Iterable[str] = cls._toolfuse_marked_observations
+
+        instance_attributes = vars(self)
+        marked_attributes = {
+            name: value
+            for name, value in instance_attributes.items()
+            if callable(value)
+            and (
+                getattr(value, "_is_action", False)
+                or getattr(value, "_is_observation", False)
+            )
+        }
+        if marked_attributes or not instance_attributes.keys().isdisjoint(
+            chain(actions, observations)
+        ):
+            # Instance attributes shadow the class attributes of the same name
+            actions = sorted(
+                {name for name in actions if name not in instance_attributes}
+                | {
+                    name
+                    for name, value in marked_attributes.items()
+                    if getattr(value, "_is_action", False)
+                }
+            )
+            observations = sorted(
+                {name for name in observations if name not in instance_attributes}
+                | {
+                    name
+                    for name, value in marked_attributes.items()
+                    if not getattr(value, "_is_action", False)
+                }
+            )
+
+        self._actions_list.extend(
+            self._toolfuse_entries(
+                Action, ((name, getattr(self, name)) for name in actions)
+            )
+        )
+        self._observations_list.extend(
+            self._toolfuse_entries(
+                Observation, ((name, getattr(self, name)) for name in observations)
+            )
+        )
+
+    def _toolfuse_entries(
+        self, entry_type: Type[Action], methods: Iterable[Tuple[str, Callable]]
+    ) -> List[Action]:
+        """
+        Creates Action or Observation instances for (name, method) pairs.
+
+        Descriptions are derived lazily from the docstrings, unless a subclass overrides
+        `_parse_docstring`; that hook then provides the description of each method right away.
+
+        Args:
+            entry_type (Type[Action]): Action or Observation.
+            methods (Iterable[Tuple[str, Callable]]): The names and methods to create entries for.
+
+        Returns:
+            List[Action]: The created entries, in the order of `methods`.
+        """
+        if type(self)._parse_docstring is Tool._parse_docstring:
+            return [entry_type(name, method) for name, method in methods]
+        parse_docstring = self._parse_docstring
+        return [
+            entry_type(name, method, description=parse_docstring(method))
+            for name, method in methods
+        ]
+
+    def _toolfuse_reset_caches(self) -> None:
+        """Discards the lookups derived from the action and observation lists after they change."""
+        self._toolfuse_by_name = None
+        self._toolfuse_merged = None
+
+    def _toolfuse_merged_lists(self) -> Tuple[List[Action], List[Observation]]:
+        """
+        Returns this tool's actions and observations combined with those of the wrapped tools.
+
+        The combined lists are kept until the lists of this tool or one of the wrapped tools are
+        replaced or change length, or `wraps` is reassigned anywhere along the chain. They are
+        rebuilt on every call if a wrapped tool overrides `actions()` or `observations()`.
+        """
+        tools = [self]
+        wrapped = self.wraps
+        while wrapped:
+            cls = type(wrapped)
+            if (
+                cls.actions is not Tool.actions
+                or cls.observations is not Tool.observations
+            ):
+                return (
+                    self._actions_list + self.wraps.actions(),
+                    self._observations_list + self.wraps.observations(),
+                )
+            tools.append(wrapped)
+            wrapped = wrapped.wraps
+        lists = [(tool._actions_list, tool._observations_list) for tool in tools]
+        state = tuple(
+            (id(tool), id(actions), len(actions), id(observations), len(observations))
+            for tool, (actions, observations) in zip(tools, lists)
+        )
+        # The tools and lists are kept in the cache entry, so their ids cannot be reused while it exists
+        if self._toolfuse_merged is None or self._toolfuse_merged[1] != state:
+            self._toolfuse_merged = (
+                (tools, lists),
+                state,
+                self._actions_list + self.wraps.actions(),
+                self._observations_list + self.wraps.observations(),
+            )
+        return self._toolfuse_merged[2], self._toolfuse_merged[3]
 
     def _parse_docstring(self, method: Callable) -> str:
         """
@@ -216,10 +575,7 @@ class Tool(ABC):
         Returns:
             str: The first sentence of the method's docstring, if available. Otherwise, an empty string.
         """
-        docstring = getdoc(method)
-        if docstring:
-            return re.split(r"\.\s+", docstring)[0]
-        return ""
+        return _first_sentence(method)
 
     def actions(self) -> List[Action]:
         """
@@ -230,10 +586,9 @@ class Tool(ABC):
         Returns:
             List[Action]: A list of Action instances representing the available actions.
         """
-        out = self._actions_list
         if self.wraps:
-            out.extend(self.wraps._actions_list)
-        return out
+            return self._toolfuse_merged_lists()[0]
+        return self._actions_list
 
     def observations(self) -> List[Observation]:
         """
@@ -245,10 +600,9 @@ class Tool(ABC):
         Returns:
             List[Observation]: A list of Observation instances representing the available observations.
         """
-        out = self._observations_list
         if self.wraps:
-            out.extend(self.wraps._observations_list)
-        return out
+            return self._toolfuse_merged_lists()[1]
+        return self._observations_list
 
     def use(self, action: Action, *args, **kwargs) -> Any:
         """
@@ -263,7 +617,7 @@ class Tool(ABC):
             Any: The result of the action execution, which can vary depending on the action.
         """
         self._validate_parameters(action.schema, kwargs)
-        return action(*args, **kwargs)
+        return action.method(*args, **kwargs)
 
     def observe(self, observation: Observation, *args, **kwargs) -> Any:
         """
@@ -277,12 +631,12 @@ class Tool(ABC):
         Returns:
             Any: The result of the observation execution, which can vary depending on the observation.
         """
-        self._validate_parameters(observation.schema, kwargs)
         if not isinstance(observation, Observation):
             raise ValueError(
                 "Actions are not observable. Use the 'use' method to perform an action."
             )
-        return observation(*args, **kwargs)
+        self._validate_parameters(observation.schema, kwargs)
+        return observation.method(*args, **kwargs)
 
     def json_schema(
         self, actions_only: bool = False, exclude_names: List[str] = []
@@ -301,15 +655,14 @@ class Tool(ABC):
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each representing the JSON schema of an action or observation not excluded.
         """
-        out = []
-        for action in self.actions():
-            if action.name not in exclude_names:
-                out.append(action.schema)
+        # The excluded names are looked up once per entry, so they are turned into a set first
+        excluded = frozenset(exclude_names)
+        entries: Iterable[Action] = self.actions()
         if not actions_only:
-            for observation in self.observations():
-                if observation.name not in exclude_names:
-                    out.append(observation.schema)
-        return out
+            entries = chain(entries, self.observations())
+        if excluded:
+            return [entry.schema for entry in entries if entry.name not in excluded]
+        return list(map(attrgetter("schema"), entries))
 
     def _validate_parameters(
         self, schema: Dict[str, Any], parameters: Dict[str, Any]
@@ -324,16 +677,17 @@ class Tool(ABC):
         Raises:
             ValidationError: If the parameters do not conform to the schema.
         """
-        try:
-            validate(instance=parameters, schema=schema)
-        except ValidationError as e:
-            raise ValueError(f"Parameter validation error: {e.message}")
+        # Same error selection as jsonschema.validate, with the validator reused across calls
+        error = best_match(_validator_for(schema).iter_errors(parameters))
+        if error is not None:
+            raise ValueError(f"Parameter validation error: {error.message}")
 
     def find_action(self, name: str) -> Optional[Action]:
         """
         Searches for an action or observation by name and returns it if found.
 
-        This method checks both the actions and observations lists for a match.
+        This method checks both the actions and observations lists for a match, looking in the
+        wrapped tools first, nearest first, and in this tool last.
 
         Args:
             name (str): The name of the action or observation to find.
@@ -342,22 +696,53 @@ class Tool(ABC):
             Optional[Action]: The Action or Observation instance with the matching name, or None if not found.
         """
 
-        if self.wraps:
-            for action in self.wraps.actions():
-                if action.name == name:
-                    return action
+        wrapped = self.wraps
+        while wrapped:
+            found = wrapped._toolfuse_find_own(name)
+            if found is not None:
+                return found
+            wrapped = wrapped.wraps
+        return self._toolfuse_find_own(name)
 
-            for observation in self.wraps.observations():
-                if observation.name == name:
-                    return observation
+    def _toolfuse_find_own(self, name: str) -> Optional[Action]:
+        """
+        Looks up an action or observation by name in this tool's own lists.
 
-        for action in self.actions():
-            if action.name == name:
-                return action
+        Lookups go through a name index that is built on first use and rebuilt whenever the action
+        or observation list is replaced or changes length, unless a subclass overrides `actions()`
+        or `observations()`, in which case their results are searched directly.
 
-        for observation in self.observations():
-            if observation.name == name:
-                return observation
+        Args:
+            name (str): The name of the action or observation to find.
+
+        Returns:
+            Optional[Action]: The first entry with the matching name, or None if not found.
+        """
+        cls = type(self)
+        if cls.actions is not Tool.actions or cls.observations is not Tool.observations:
+            # Overridden accessors can change without resetting the index, so they are scanned
+            for entry in chain(self.actions(), self.observations()):
+                if entry.name == name:
+                    return entry
+            return None
+
+        actions, observations = self._actions_list, self._observations_list
+        state = (actions, len(actions), observations, len(observations))
+        cached = self._toolfuse_by_name
+        if (
+            cached is None
+            or cached[0] is not actions
+            or cached[1] != state[1]
+            or cached[2] is not observations
+            or cached[3] != state[3]
+        ):
+            by_name: Dict[str, Action] = {}
+            for action in actions:
+                by_name.setdefault(action.name, action)
+            for observation in observations:
+                by_name.setdefault(observation.name, observation)
+            cached = self._toolfuse_by_name = state + (by_name,)
+        return cached[4].get(name)
 
     def close(self) -> None:
         """
@@ -385,17 +770,16 @@ class Tool(ABC):
         """
         return cls.__name__
 
-    def ref(self) -> V1ToolRef:
+    def ref(self) -> "V1ToolRef":
         """Tool reference"""
+        # pydantic is imported on first use, so importing toolfuse does not pay for it
+        from .models import V1ToolRef
+
         module = getmodule(self)
         if not module:
             raise ValueError("Tool not associated with a module")
         mod_parts = module.__name__.split(".")
-        version = None
-        try:
-            version = pkgversion(mod_parts[0])
-        except:
-            pass
+        version = _package_version(mod_parts[0])
         return V1ToolRef(module=module.__name__, type=self.type(), version=version)
 
     def add_action(self, method: Callable) -> None:
@@ -414,6 +798,7 @@ class Tool(ABC):
 
         action = Action(name, method, schema, description)
         self._actions_list.append(action)
+        self._toolfuse_reset_caches()
 
     def add_observation(self, method: Callable) -> None:
         """
@@ -431,6 +816,7 @@ class Tool(ABC):
 
         observation = Observation(name, method, schema, description)
         self._observations_list.append(observation)
+        self._toolfuse_reset_caches()
 
     def _generate_schema(self, method: Callable) -> Dict[str, Any]:
         """
@@ -444,7 +830,7 @@ class Tool(ABC):
             Dict[str, Any]: A schema representing the parameters and their types.
         """
         # Example implementation using inspect to generate parameter types
-        params = inspect.signature(method).parameters
+        params = _signature_for(method).parameters
         return {param: str(ptype.annotation) for param, ptype in params.items()}
 
     def add_actions(self, methods: List[Callable]) -> None:
@@ -455,8 +841,28 @@ class Tool(ABC):
         Args:
             methods (List[Callable]): A list of callable methods that implement actions.
         """
-        for method in methods:
-            self.add_action(method)
+        if type(self).add_action is not Tool.add_action:
+            # An overridden add_action is called for each method, as it always was
+            for method in methods:
+                self.add_action(method)
+            return
+
+        # Same entries as calling add_action for each method, with the derived caches reset once.
+        # If a method fails, the ones before it stay registered, so the caches are reset regardless
+        generate_schema = self._generate_schema
+        parse_docstring = self._parse_docstring
+        try:
+            self._actions_list.extend(
+                Action(
+                    method.__name__,
+                    method,
+                    generate_schema(method),
+                    parse_docstring(method),
+                )
+                for method in methods
+            )
+        finally:
+            self._toolfuse_reset_caches()
 
     def add_observations(self, methods: List[Callable]) -> None:
         """
@@ -466,8 +872,28 @@ class Tool(ABC):
         Args:
             methods (List[Callable]): A list of callable methods that implement observations.
         """
-        for method in methods:
-            self.add_observation(method)
+        if type(self).add_observation is not Tool.add_observation:
+            # An overridden add_observation is called for each method, as it always was
+            for method in methods:
+                self.add_observation(method)
+            return
+
+        # Same entries as calling add_observation for each method, with the derived caches reset once.
+        # If a method fails, the ones before it stay registered, so the caches are reset regardless
+        generate_schema = self._generate_schema
+        parse_docstring = self._parse_docstring
+        try:
+            self._observations_list.extend(
+                Observation(
+                    method.__name__,
+                    method,
+                    generate_schema(method),
+                    parse_docstring(method),
+                )
+                for method in methods
+            )
+        finally:
+            self._toolfuse_reset_caches()
 
     def _add_action(
         self,
@@ -488,6 +914,7 @@ class Tool(ABC):
             name, method, schema or {}, description or self._parse_docstring(method)
         )
         self._actions_list.append(action)
+        self._toolfuse_reset_caches()
 
     def _add_observation(
         self,
@@ -507,6 +934,7 @@ class Tool(ABC):
             name, method, schema or {}, description or self._parse_docstring(method)
         )
         self._observations_list.append(observation)
+        self._toolfuse_reset_caches()
 
     def merge(self, other: "Tool") -> None:
         """
@@ -515,29 +943,119 @@ class Tool(ABC):
         Args:
             other (Tool): The tool to merge into this tool.
         """
-        for action in other.actions():
-            self._add_action(
-                action.method, action.name, action.schema, action.description
-            )
-        for observation in other.observations():
-            self._add_observation(
-                observation.method,
-                observation.name,
-                observation.schema,
-                observation.description,
-            )
+        cls = type(self)
+        if cls._add_action is not Tool._add_action:
+            # An overridden _add_action is called for each entry, as it always was
+            for action in other.actions():
+                self._add_action(
+                    action.method, action.name, action.schema, action.description
+                )
+            actions: Iterable[Action] = ()
+        else:
+            actions = other.actions()
+        if cls._add_observation is not Tool._add_observation:
+            for observation in other.observations():
+                self._add_observation(
+                    observation.method,
+                    observation.name,
+                    observation.schema,
+                    observation.description,
+                )
+            observations: Iterable[Observation] = ()
+        else:
+            observations = other.observations()
+
+        # Same duplicate handling as _add_action and _add_observation, with the existing names
+        # collected once instead of scanning the lists for every merged entry. Schemas are derived
+        # lazily and may fail part way, so the caches are reset for whatever was merged by then
+        merged = False
+        try:
+            names = {action.name for action in self._actions_list}
+            for action in actions:
+                name = action.name or action.method.__name__
+                if name in names:
+                    continue
+                names.add(name)
+                self._actions_list.append(
+                    Action(
+                        name,
+                        action.method,
+                        action.schema or {},
+                        action.description or self._parse_docstring(action.method),
+                    )
+                )
+                merged = True
+
+            names = {observation.name for observation in self._observations_list}
+            for observation in observations:
+                name = observation.name or observation.method.__name__
+                if name in names:
+                    continue
+                names.add(name)
+                self._observations_list.append(
+                    Observation(
+                        name,
+                        observation.method,
+                        observation.schema or {},
+                        observation.description
+                        or self._parse_docstring(observation.method),
+                    )
+                )
+                merged = True
+        finally:
+            if merged:
+                self._toolfuse_reset_caches()
+
+
+# Attributes under which the Tool subclasses generated by the converters are kept on their input
+_CLASS_TOOL = "_toolfuse_class_tool"
+_FUNCTION_TOOL = "_toolfuse_function_tool"
+_OBJECT_TOOL = "_toolfuse_object_tool"
+
+
+def _generated_tool(owner: Any, attribute: str) -> Optional[Type[Tool]]:
+    """
+    Returns the Tool subclass previously generated for a class or function, or None.
+
+    Only the owner's own namespace is read, so a subclass does not pick up the tool of its base,
+    and the tool must have been generated from the owner itself: namespaces can be copied, e.g. by
+    functools.wraps, to wrappers that need a tool of their own.
+    """
+    generated = getattr(owner, "__dict__", {}).get(attribute)
+    if generated is not None and generated.__dict__.get("_toolfuse_source") is owner:
+        return generated
+    return None
+
+
+def _remember_generated_tool(owner: Any, attribute: str, generated: Type[Tool]) -> None:
+    """
+    Keeps a generated Tool subclass on the class or function it was generated from.
+
+    The two then reference each other at most, so they are collected together once neither is in use,
+    unlike with a module-level cache. Owners whose attributes cannot be set are not memoized.
+    """
+    try:
+        setattr(owner, attribute, generated)
+    except (AttributeError, TypeError):
+        return
+    generated._toolfuse_source = owner
 
 
 def tool_from_cls(cls: Type[T]) -> Type[Tool]:
     """
     Dynamically creates a subclass of `Tool` that integrates methods from a given class `cls` as actions.
 
+    The subclass is created once per class; later calls with the same class return the same subclass.
+
     Args:
         cls (Type[T]): The class from which to create a Tool, integrating its methods as actions.
 
     Returns:
         Type[Tool]: A new subclass of Tool that includes actions derived from `cls` methods.
     """
+    generated = _generated_tool(cls, _CLASS_TOOL)
+    if generated is not None:
+        return generated
 
     class Combined(Tool, cls):
         """
@@ -587,34 +1105,33 @@ def tool_from_cls(cls: Type[T]) -> Type[Tool]:
             """
             Registers all public methods from the user-defined class (cls) as actions.
 
-            This method iterates over all public methods of cls and registers them as actions,
-            allowing them to be utilized within the Tool framework.
+            This method binds the public methods of cls, collected once when the class is created,
+            and registers them as actions, allowing them to be utilized within the Tool framework.
             """
-            for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-                # Skip private and protected methods, skip methods from Tool or object class
-                if (
-                    name.startswith("_")
-                    or inspect.getmodule(method) == inspect.getmodule(Tool)
-                    or inspect.getmodule(method) == inspect.getmodule(object)
-                ):
-                    continue
-
-                # Wrap the method to get its schema
-                wrapper = FunctionWrapper(method)
-
-                # Use the existing method to create a description based on the method's docstring
-                description = self._parse_docstring(method)
-
-                # Use the schema generated by FunctionWrapper
-                schema = wrapper.schema
-
-                # Create an Action instance for the method
-                action = Action(name, method, schema, description)
-
-                # Add the Action to the tool's actions list
-                self._actions_list.append(action)
+            # Create an Action instance for each method and add it to the tool's actions list;
+            # schemas and descriptions are derived on first access and shared across instances
+            self._actions_list.extend(
+                self._toolfuse_entries(
+                    Action,
+                    (
+                        (name, getattr(self, name))
+                        for name in self._toolfuse_method_names
+                    ),
+                )
+            )
 
+    # The methods to register are a property of the class, so they are collected once here,
+    # skipping methods from Tool or object class and those Tool.__init__ already registered
+    # because they are marked with @action
+    skipped_modules = (inspect.getmodule(Tool), inspect.getmodule(object))
+    marked = set(Combined._toolfuse_marked_actions)
+    Combined._toolfuse_method_names = tuple(
+        name
+        for name, function in _public_functions(Combined)
+        if name not in marked and inspect.getmodule(function) not in skipped_modules
+    )
     Combined.__name__ = f"{cls.__name__}Tool"
+    _remember_generated_tool(cls, _CLASS_TOOL, Combined)
     return Combined
 
 
@@ -622,12 +1139,17 @@ def tool_from_function(function: Callable) -> Type[Tool]:
     """
     Dynamically creates a subclass of `Tool` that encapsulates a given function as an action.
 
+    The subclass is created once per function; later calls with the same function return the same subclass.
+
     Args:
         function (Callable): The function to be encapsulated as an action in the Tool.
 
     Returns:
         Type[Tool]: A new subclass of Tool that includes the given function as an action.
     """
+    generated = _generated_tool(function, _FUNCTION_TOOL)
+    if generated is not None:
+        return generated
 
     class FunctionTool(Tool):
         """
@@ -659,30 +1181,19 @@ def tool_from_function(function: Callable) -> Type[Tool]:
             """
             Registers the provided function as an action for the Tool.
 
-            This method wraps the given function to extract its schema and documentation, creating an Action instance that encapsulates the function. This allows the function to be called as an action within the Tool's environment.
+            This method creates an Action instance that encapsulates the function, with its schema and documentation extracted on first access. This allows the function to be called as an action within the Tool's environment.
 
             Args:
                 function (Callable): The function to be registered as an action.
             """
-            # Wrap the function to get its schema
-            wrapper = FunctionWrapper(function)
-
-            # Generate a description from the function's docstring
-            description = self._parse_docstring(function)
-
-            # Use the schema generated by FunctionWrapper
-            schema = wrapper.schema
-
-            # Extract the name of the function to use as the action name
-            name = function.__name__
-
-            # Create an Action instance for the function
-            action = Action(name, function, schema, description)
-
-            # Add the Action to the tool's actions list
-            self._actions_list.append(action)
+            # Create an Action instance for the function and add it to the tool's actions list;
+            # its schema and description are derived from the function on first access
+            self._actions_list.extend(
+                self._toolfuse_entries(Action, [(function.__name__, function)])
+            )
 
     FunctionTool.__name__ = f"{function.__name__}_tool"
+    _remember_generated_tool(function, _FUNCTION_TOOL, FunctionTool)
     return FunctionTool
 
 
@@ -696,6 +1207,25 @@ def tool_from_object(obj: Any) -> Tool:
     Returns:
         Tool: A new subclass of Tool that includes the object's methods as actions.
     """
+    # Return an instance of ObjectTool instead of the class itself, as we need to pass the object instance to it
+    return _object_tool_class(obj.__class__)(obj)  # type: ignore
+
+
+def _object_tool_class(obj_cls: type) -> Type[Tool]:
+    """
+    Creates the `Tool` subclass used by `tool_from_object` for instances of a class.
+
+    The subclass is created once per class; only the bound methods differ between the objects it wraps.
+
+    Args:
+        obj_cls (type): The class of the objects to wrap.
+
+    Returns:
+        Type[Tool]: A subclass of Tool that registers the public methods of a wrapped instance as actions.
+    """
+    generated = _generated_tool(obj_cls, _OBJECT_TOOL)
+    if generated is not None:
+        return generated
 
     class ObjectTool(Tool):
         """
@@ -728,39 +1258,31 @@ def tool_from_object(obj: Any) -> Tool:
             """
             Registers all public methods of the object instance as actions for the Tool.
 
-            This method iterates over all public methods of the provided object instance, excluding private, protected, and dunder methods. Each method is wrapped as an `Action` object and added to the tool's actions list.
+            This method binds the public methods of the object's class, excluding private, protected, and dunder methods, collected once when the class is created. Each method is wrapped as an `Action` object and added to the tool's actions list.
             """
-            for name, method in inspect.getmembers(
-                self.obj_instance, predicate=inspect.ismethod
-            ):
-                # Skip private and protected methods, and skip dunder methods
-                if name.startswith("_"):
-                    continue
-
-                # Skip methods not defined in the class of obj_instance (e.g., inherited from object)
-                if inspect.getmodule(method.__func__) != inspect.getmodule(
-                    self.obj_instance.__class__
-                ):
-                    continue
-
-                # Wrap the method to get its schema
-                wrapper = FunctionWrapper(method)
-
-                # Generate a description from the method's docstring
-                description = self._parse_docstring(method)
-
-                # Use the schema generated by FunctionWrapper
-                schema = wrapper.schema
-
-                # Create an Action instance for the method
-                action = Action(name, method, schema, description)
-
-                # Add the Action to the tool's actions list
-                self._actions_list.append(action)
+            # Create an Action instance for each method and add it to the tool's actions list;
+            # schemas and descriptions are derived on first access and shared across instances
+            obj_instance = self.obj_instance
+            self._actions_list.extend(
+                self._toolfuse_entries(
+                    Action,
+                    (
+                        (name, getattr(obj_instance, name))
+                        for name in self._toolfuse_method_names
+                    ),
+                )
+            )
 
-    ObjectTool.__name__ = f"{obj.__class__.__name__}Tool"
-    # Return an instance of ObjectTool instead of the class itself, as we need to pass the object instance to it
-    return ObjectTool(obj)  # type: ignore
+    # Skip methods not defined in the module of the object's class (e.g., inherited from object)
+    obj_module = inspect.getmodule(obj_cls)
+    ObjectTool._toolfuse_method_names = tuple(
+        name
+        for name, function in _public_functions(obj_cls)
+        if inspect.getmodule(function) is obj_module
+    )
+    ObjectTool.__name__ = f"{obj_cls.__name__}Tool"
+    _remember_generated_tool(obj_cls, _OBJECT_TOOL, ObjectTool)
+    return ObjectTool
 
 
 def tool(input: Union[Type, Callable, Any]) -> Union[Type[Tool], Tool]:
@@ -779,10 +1301,11 @@ def tool(input: Union[Type, Callable, Any]) -> Union[Type[Tool], Tool]:
         Union[Type[Tool], Tool]: A Tool class if the input is a class or function, or a Tool
                                  instance if the input is an object instance.
     """
-    if inspect.isclass(input):
+    # Same checks as inspect.isclass and inspect.isfunction, without the extra calls
+    if isinstance(input, type):
         # Input is a class, so we use tool_from_cls
         return tool_from_cls(input)
-    elif inspect.isfunction(input):
+    elif isinstance(input, FunctionType):
         # Input is a function, so we use tool_from_function
         return tool_from_function(input)
     else:
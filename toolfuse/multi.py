@@ -1,3 +1,5 @@
+from itertools import chain
+from operator import methodcaller
 from typing import List
 
 from .base import Tool
@@ -20,11 +22,10 @@ class MultiTool(Tool):
         """
         Overrides the _register_methods of Tool to aggregate methods from sub-tools rather than looking at its own methods.
         """
-        # Clear any existing actions and observations
-        self._actions_list = []
-        self._observations_list = []
-
-        # Aggregate actions and observations from all contained tools
-        for tool in self.tools:
-            self._actions_list.extend(tool.actions())
-            self._observations_list.extend(tool.observations())
+        # Aggregate actions and observations from all contained tools, replacing any existing ones
+        self._actions_list = list(
+            chain.from_iterable(map(methodcaller("actions"), self.tools))
+        )
+        self._observations_list = list(
+            chain.from_iterable(map(methodcaller("observations"), self.tools))
+        )